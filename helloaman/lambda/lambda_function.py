@@ -2,7 +2,9 @@
 
 import json
 import logging
-from typing import Dict, Any
+import os
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 import ask_sdk_core.utils as ask_utils
 from ask_sdk_core.dispatch_components import AbstractExceptionHandler
@@ -11,22 +13,60 @@ from ask_sdk_core.handler_input import HandlerInput
 from ask_sdk_core.skill_builder import SkillBuilder
 from ask_sdk_core.utils import (
     is_request_type, is_intent_name, get_supported_interfaces)
-from ask_sdk_model import Response
-from ask_sdk_model.interfaces.alexa.presentation.apl import (
-    RenderDocumentDirective, AnimatedOpacityProperty, AnimateItemCommand,
-    ExecuteCommandsDirective, UserEvent)
-from ask_sdk_model.ui import SimpleCard
+from ask_sdk_model import RequestEnvelope, Response
+from ask_sdk_model.directive import Directive
 
-# APL Document file paths for use in handlers
-hello_world_doc_path = "helloworldDocument.json"
-hello_world_button_doc_path = "helloworldWithButtonDocument.json"
+if TYPE_CHECKING:
+    from ask_sdk_model.interfaces.alexa.presentation.apl import (
+        RenderDocumentDirective, UserEvent)
+    from ask_sdk_model.ui import SimpleCard
+
+# APL Document file paths for use in handlers, resolved against this module
+# so the documents load at import regardless of the working directory
+_module_dir = os.path.dirname(os.path.abspath(__file__))
+hello_world_doc_path = os.path.join(_module_dir, "helloworldDocument.json")
+hello_world_button_doc_path = os.path.join(
+    _module_dir, "helloworldWithButtonDocument.json")
 
 # Tokens used when sending the APL directives
 HELLO_WORLD_TOKEN = "helloworldToken"
 HELLO_WORLD_WITH_BUTTON_TOKEN = "helloworldWithButtonToken"
 
+# Output speech used by the APL handlers
+_HW_APL_SPEECH = ("Hello World! You should now also see my greeting on the "
+                  "screen.")
+_HW_BUTTON_APL_SPEECH = ("Hello World! Welcome to Alexa Presentation "
+                         "Language. Click the button to see what happens!")
+_HW_NOAPL_SPEECH = ("Hello World! This example would be more interesting on a "
+                    "device with a screen, such as an Echo Show or Fire TV.")
+_START_OVER_SPEECH = "OK, I'm going to try to bring that text back into view."
+_START_OVER_NOTHING_TO_RESET_SPEECH = (
+    "Hmm, there isn't anything for me to reset. Try invoking the 'hello world "
+    "with button intent', then click the button and see what happens!")
+_START_OVER_NOAPL_SPEECH = (
+    "Hello, this example would be more interesting on a device with a screen. "
+    "Try it on an Echo Show, Echo Spot or a Fire TV device.")
+
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+
+
+def _log_level_from_env():
+    # type: () -> int
+    """Read the log level from LOG_LEVEL, accepting level names in any case
+    or numeric levels. Unknown values fall back to WARNING with a warning, as
+    an invalid level would otherwise fail the import on every cold start.
+    """
+    value = (os.environ.get("LOG_LEVEL") or "WARNING").strip()
+    if value.isdigit():
+        return int(value)
+    level = getattr(logging, value.upper(), None)
+    if isinstance(level, int):
+        return level
+    logger.warning("Unknown LOG_LEVEL %r, using WARNING", value)
+    return logging.WARNING
+
+
+logger.setLevel(_log_level_from_env())
 
 
 def _load_apl_document(file_path):
@@ -36,20 +76,111 @@ def _load_apl_document(file_path):
         return json.load(f)
 
 
+def _apl_supported(handler_input):
+    # type: (HandlerInput) -> bool
+    """Check whether the device supports APL, memoized on the request
+    attributes so repeated checks within one request are a dict lookup.
+    """
+    request_attributes = handler_input.attributes_manager.request_attributes
+    supported = request_attributes.get("_apl")
+    if supported is None:
+        supported = get_supported_interfaces(
+            handler_input).alexa_presentation_apl is not None
+        request_attributes["_apl"] = supported
+    return supported
+
+
+# APL documents are immutable for the lifetime of the container, so parse
+# them once at import and reuse the dicts across warm invocations.
+HELLO_WORLD_DOC = _load_apl_document(hello_world_doc_path)
+HELLO_WORLD_WITH_BUTTON_DOC = _load_apl_document(hello_world_button_doc_path)
+
+
+
+class _PrebuiltDirective(Directive):
+    """Directive sent as an already-serialized payload dict.
+
+    Exposes the payload keys through ``attribute_map`` and
+    ``deserialized_types`` so the SDK serializer emits it unchanged, while
+    still being a ``Directive`` with an ``object_type`` for ResponseFactory.
+    """
+
+    def __init__(self, payload):
+        # type: (Dict[str, Any]) -> None
+        super().__init__(object_type=payload["type"])
+        self._payload = payload
+        fields = [key for key in payload if key != "type"]
+        self.attribute_map = dict(
+            {key: key for key in fields}, object_type="type")
+        self.deserialized_types = {
+            attr: "object" for attr in self.attribute_map}
+        for key in fields:
+            setattr(self, key, payload[key])
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        return self._payload
+
+
+# ExecuteCommands directive fading the hello text back in. The payload never
+# changes, so it is built once in its serialized form rather than from
+# AnimateItemCommand / ExecuteCommandsDirective objects on every request.
+_FADE_BACK_DIRECTIVE = _PrebuiltDirective({
+    "type": "Alexa.Presentation.APL.ExecuteCommands",
+    "token": HELLO_WORLD_WITH_BUTTON_TOKEN,
+    "commands": [
+        {
+            "type": "AnimateItem",
+            "componentId": "helloTextComponent",
+            "duration": 3000,
+            "easing": "linear",
+            "value": [{"property": "opacity", "to": 1.0}]
+        }
+    ]
+})
+
+_CARD_SPEECH = "This is the text Alexa speaks. Go to the Alexa app to see the card!"
+_CARD_TITLE = "This is the Title of the Card"
+_CARD_TEXT = "This is the card content. This card just has plain text content.\r\nThe content is formated with line breaks to improve readability."
+
+
+@lru_cache(maxsize=None)
+def _render_document_directive(token):
+    # type: (str) -> RenderDocumentDirective
+    """Build the RenderDocument directive for the APL document identified by
+    token once and reuse it, keeping the APL model import off non-APL paths.
+    """
+    from ask_sdk_model.interfaces.alexa.presentation.apl import (
+        RenderDocumentDirective)
+    documents = {
+        HELLO_WORLD_TOKEN: HELLO_WORLD_DOC,
+        HELLO_WORLD_WITH_BUTTON_TOKEN: HELLO_WORLD_WITH_BUTTON_DOC,
+    }
+    return RenderDocumentDirective(token=token, document=documents[token])
+
+
+@lru_cache(maxsize=None)
+def _card():
+    # type: () -> SimpleCard
+    """Build the constant SimpleCard sent by CardIntentHandler once."""
+    from ask_sdk_model.ui import SimpleCard
+    return SimpleCard(_CARD_TITLE, _CARD_TEXT)
+
+
 class StartOverIntentHandler(AbstractRequestHandler):
     """Handler for StartOverIntent."""
 
+    _match = staticmethod(is_intent_name("AMAZON.StartOverIntent"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-        return is_intent_name("AMAZON.StartOverIntent")(handler_input)
+        return self._match(handler_input)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
-        speak_output = None
         response_builder = handler_input.response_builder
 
-        if get_supported_interfaces(
-                handler_input).alexa_presentation_apl is not None:
+        if _apl_supported(handler_input):
             # Get the APL visual context information from the JSON request
             # and check that the document identified by the
             # HELLO_WORLD_WITH_BUTTON_TOKEN token ("helloworldWithButtonToken")
@@ -57,37 +188,23 @@ class StartOverIntentHandler(AbstractRequestHandler):
             context_apl = handler_input.request_envelope.context.alexa_presentation_apl
             if (context_apl is not None and
                     context_apl.token == HELLO_WORLD_WITH_BUTTON_TOKEN):
-                speak_output = ("OK, I'm going to try to bring that text "
-                                "back into view.")
-                animate_item_command = AnimateItemCommand(
-                    component_id="helloTextComponent",
-                    duration=3000,
-                    value=[AnimatedOpacityProperty(to=1.0)]
-                )
-                response_builder.add_directive(
-                    ExecuteCommandsDirective(
-                        token=HELLO_WORLD_WITH_BUTTON_TOKEN,
-                        commands=[animate_item_command]
-                    )
-                )
+                speak_output = _START_OVER_SPEECH
+                response_builder.add_directive(_FADE_BACK_DIRECTIVE)
             else:
                 # Device is NOT displaying the expected document, so provide
                 # relevant output speech.
-                speak_output = ("Hmm, there isn't anything for me to reset. "
-                                "Try invoking the 'hello world with button "
-                                "intent', then click the button and see what "
-                                "happens!")
+                speak_output = _START_OVER_NOTHING_TO_RESET_SPEECH
         else:
             # User's device does not support APL, so tailor the speech to
             # this situation
-            speak_output += ("Hello, this example would be more interesting on "
-                             "a device with a screen. Try it on an Echo Show, "
-                             "Echo Spot or a Fire TV device.")
+            speak_output = _START_OVER_NOAPL_SPEECH
 
         return response_builder.speak(speak_output).response
 
 
 class HelloWorldButtonEventHandler(AbstractRequestHandler):
+    _match = staticmethod(is_request_type("Alexa.Presentation.APL.UserEvent"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
         # Since an APL skill might have multiple buttons that generate
@@ -98,7 +215,7 @@ class HelloWorldButtonEventHandler(AbstractRequestHandler):
 
         # The user_event.source is a dict object. We can retrieve the id
         # using the get method on the dictionary.
-        if is_request_type("Alexa.Presentation.APL.UserEvent")(handler_input):
+        if self._match(handler_input):
             user_event = handler_input.request_envelope.request  # type: UserEvent
             return user_event.source.get("id") == "fadeHelloTextButton"
         else:
@@ -118,32 +235,25 @@ class HelloWorldButtonEventHandler(AbstractRequestHandler):
 class HelloWorldWithButtonIntentHandler(AbstractRequestHandler):
     """Handler for Hello World Intent."""
 
+    _match = staticmethod(is_intent_name("HelloWorldWithButtonIntent"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-        return is_intent_name("HelloWorldWithButtonIntent")(handler_input)
+        return self._match(handler_input)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
-        speak_output = "Hello World!"
         response_builder = handler_input.response_builder
 
-        if get_supported_interfaces(
-                handler_input).alexa_presentation_apl is not None:
+        if _apl_supported(handler_input):
             response_builder.add_directive(
-                RenderDocumentDirective(
-                    token=HELLO_WORLD_WITH_BUTTON_TOKEN,
-                    document=_load_apl_document(hello_world_button_doc_path)
-                )
-            )
+                _render_document_directive(HELLO_WORLD_WITH_BUTTON_TOKEN))
             # Tailor the speech for a device with a screen
-            speak_output += (" Welcome to Alexa Presentation Language. "
-                             "Click the button to see what happens!")
+            speak_output = _HW_BUTTON_APL_SPEECH
         else:
             # User's device does not support APL, so tailor the speech to
             # this situation
-            speak_output += (" This example would be more interesting on a "
-                             "device with a screen, such as an Echo Show or "
-                             "Fire TV.")
+            speak_output = _HW_NOAPL_SPEECH
 
         return response_builder.speak(speak_output).response
 
@@ -151,32 +261,25 @@ class HelloWorldWithButtonIntentHandler(AbstractRequestHandler):
 class HelloWorldIntentHandler(AbstractRequestHandler):
     """Handler for Hello World Intent."""
 
+    _match = staticmethod(is_intent_name("HelloWorldIntent"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-        return is_intent_name("HelloWorldIntent")(handler_input)
+        return self._match(handler_input)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
-        speak_output = "Hello World!"
         response_builder = handler_input.response_builder
 
-        if get_supported_interfaces(
-                handler_input).alexa_presentation_apl is not None:
+        if _apl_supported(handler_input):
             response_builder.add_directive(
-                RenderDocumentDirective(
-                    token=HELLO_WORLD_TOKEN,
-                    document=_load_apl_document(hello_world_doc_path)
-                )
-            )
+                _render_document_directive(HELLO_WORLD_TOKEN))
             # Tailor the speech for a device with a screen
-            speak_output += (" You should now also see my greeting on the "
-                             "screen.")
+            speak_output = _HW_APL_SPEECH
         else:
             # User's device does not support APL, so tailor the speech to
             # this situation
-            speak_output += (" This example would be more interesting on a "
-                             "device with a screen, such as an Echo Show or "
-                             "Fire TV.")
+            speak_output = _HW_NOAPL_SPEECH
 
         return response_builder.speak(speak_output).response
 
@@ -184,10 +287,11 @@ class HelloWorldIntentHandler(AbstractRequestHandler):
 class LaunchRequestHandler(AbstractRequestHandler):
     """Handler for Skill Launch."""
 
+    _match = staticmethod(ask_utils.is_request_type("LaunchRequest"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-
-        return ask_utils.is_request_type("LaunchRequest")(handler_input)
+        return self._match(handler_input)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
@@ -204,9 +308,11 @@ class LaunchRequestHandler(AbstractRequestHandler):
 class okIntentHandler(AbstractRequestHandler):
     """Handler for Hello World Intent."""
 
+    _match = staticmethod(ask_utils.is_intent_name("okIntent"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-        return ask_utils.is_intent_name("okIntent")(handler_input)
+        return self._match(handler_input)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
@@ -223,27 +329,26 @@ class okIntentHandler(AbstractRequestHandler):
 class CardIntentHandler(AbstractRequestHandler):
     """Handler for Hello World Intent."""
 
+    _match = staticmethod(is_intent_name("CardIntent"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-        return is_intent_name("CardIntent")(handler_input)
+        return self._match(handler_input)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
-
-        speech_text = "This is the text Alexa speaks. Go to the Alexa app to see the card!"
-        card_title = "This is the Title of the Card"
-        card_text = "This is the card content. This card just has plain text content.\r\nThe content is formated with line breaks to improve readability."
-
-        return handler_input.response_builder.speak(speech_text).set_card(
-            SimpleCard(card_title, card_text)).response
+        return handler_input.response_builder.speak(_CARD_SPEECH).set_card(
+            _card()).response
 
 
 class HelpIntentHandler(AbstractRequestHandler):
     """Handler for Help Intent."""
 
+    _match = staticmethod(ask_utils.is_intent_name("AMAZON.HelpIntent"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-        return ask_utils.is_intent_name("AMAZON.HelpIntent")(handler_input)
+        return self._match(handler_input)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
@@ -260,10 +365,12 @@ class HelpIntentHandler(AbstractRequestHandler):
 class CancelOrStopIntentHandler(AbstractRequestHandler):
     """Single handler for Cancel and Stop Intent."""
 
+    _matchers = (ask_utils.is_intent_name("AMAZON.CancelIntent"),
+                 ask_utils.is_intent_name("AMAZON.StopIntent"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-        return (ask_utils.is_intent_name("AMAZON.CancelIntent")(handler_input) or
-                ask_utils.is_intent_name("AMAZON.StopIntent")(handler_input))
+        return any(match(handler_input) for match in self._matchers)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
@@ -279,9 +386,11 @@ class CancelOrStopIntentHandler(AbstractRequestHandler):
 class SessionEndedRequestHandler(AbstractRequestHandler):
     """Handler for Session End."""
 
+    _match = staticmethod(ask_utils.is_request_type("SessionEndedRequest"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-        return ask_utils.is_request_type("SessionEndedRequest")(handler_input)
+        return self._match(handler_input)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
@@ -298,14 +407,16 @@ class IntentReflectorHandler(AbstractRequestHandler):
     handler chain below.
     """
 
+    _match = staticmethod(ask_utils.is_request_type("IntentRequest"))
+
     def can_handle(self, handler_input):
         # type: (HandlerInput) -> bool
-        return ask_utils.is_request_type("IntentRequest")(handler_input)
+        return self._match(handler_input)
 
     def handle(self, handler_input):
         # type: (HandlerInput) -> Response
         intent_name = ask_utils.get_intent_name(handler_input)
-        speak_output = "You just triggered " + intent_name + "."
+        speak_output = f"You just triggered {intent_name}."
 
         return (
             handler_input.response_builder
@@ -327,7 +438,9 @@ class CatchAllExceptionHandler(AbstractExceptionHandler):
 
     def handle(self, handler_input, exception):
         # type: (HandlerInput, Exception) -> Response
-        logger.error(exception, exc_info=True)
+        # Only pay for formatting the traceback when debug logging is on.
+        logger.error("handler error: %r", exception,
+                     exc_info=logger.isEnabledFor(logging.DEBUG))
 
         speak_output = "Sorry, I had trouble doing what you asked. Please try again."
 
@@ -339,27 +452,132 @@ class CatchAllExceptionHandler(AbstractExceptionHandler):
         )
 
 
+class RequestRouter(AbstractRequestHandler):
+    """Route requests to handlers with a single dict lookup on the
+    (request type, intent name) pair instead of scanning the handler chain.
+    Routes keyed with an intent name of None match any request of that type
+    and are tried when there is no exact match, or when the exact match
+    declines the request.
+
+    The routed handler's own can_handle is always consulted, so handlers that
+    check more than the request type (e.g. the button event handler matching
+    on the event source ID) keep working without extra configuration.
+    """
+
+    def __init__(self, routes):
+        # type: (Dict[Tuple[str, Optional[str]], AbstractRequestHandler]) -> None
+        self._routes = routes
+
+    def _resolve(self, handler_input):
+        # type: (HandlerInput) -> Optional[AbstractRequestHandler]
+        request = handler_input.request_envelope.request
+        request_type = request.object_type
+        intent_name = getattr(getattr(request, "intent", None), "name", None)
+
+        keys = ((request_type, intent_name), (request_type, None))
+        if intent_name is None:
+            keys = keys[1:]
+        for key in keys:
+            handler = self._routes.get(key)
+            if handler is not None and handler.can_handle(handler_input):
+                return handler
+        return None
+
+    def can_handle(self, handler_input):
+        # type: (HandlerInput) -> bool
+        # Resolve once and stash the handler for handle() on the same request.
+        handler = self._resolve(handler_input)
+        handler_input.attributes_manager.request_attributes["_route"] = handler
+        return handler is not None
+
+    def handle(self, handler_input):
+        # type: (HandlerInput) -> Response
+        request_attributes = handler_input.attributes_manager.request_attributes
+        handler = request_attributes.pop("_route", None)
+        if handler is None:
+            handler = self._resolve(handler_input)
+        return handler.handle(handler_input)
+
+
+# Handlers are stateless, so create one instance of each per container and
+# share it wherever it is referenced.
+LAUNCH_HANDLER = LaunchRequestHandler()
+HELLO_WORLD_HANDLER = HelloWorldIntentHandler()
+HELLO_WORLD_WITH_BUTTON_HANDLER = HelloWorldWithButtonIntentHandler()
+HELLO_WORLD_BUTTON_EVENT_HANDLER = HelloWorldButtonEventHandler()
+START_OVER_HANDLER = StartOverIntentHandler()
+OK_HANDLER = okIntentHandler()
+CARD_HANDLER = CardIntentHandler()
+HELP_HANDLER = HelpIntentHandler()
+CANCEL_OR_STOP_HANDLER = CancelOrStopIntentHandler()
+SESSION_ENDED_HANDLER = SessionEndedRequestHandler()
+INTENT_REFLECTOR_HANDLER = IntentReflectorHandler()
+CATCH_ALL_EXCEPTION_HANDLER = CatchAllExceptionHandler()
+
+# Every request is routed by the RequestRouter below. Make sure any new handlers
+# you've defined are added to the routes, keyed by (request type, intent name).
+# Use None as the intent name to catch any request of that type, which is how
+# IntentReflectorHandler picks up intents without a dedicated handler.
+_ROUTES = {
+    ("LaunchRequest", None): LAUNCH_HANDLER,
+    ("IntentRequest", "HelloWorldIntent"): HELLO_WORLD_HANDLER,
+    ("IntentRequest", "HelloWorldWithButtonIntent"):
+        HELLO_WORLD_WITH_BUTTON_HANDLER,
+    ("Alexa.Presentation.APL.UserEvent", None):
+        HELLO_WORLD_BUTTON_EVENT_HANDLER,
+    ("IntentRequest", "AMAZON.StartOverIntent"): START_OVER_HANDLER,
+    ("IntentRequest", "okIntent"): OK_HANDLER,
+    ("IntentRequest", "CardIntent"): CARD_HANDLER,
+    ("IntentRequest", "AMAZON.HelpIntent"): HELP_HANDLER,
+    ("IntentRequest", "AMAZON.CancelIntent"): CANCEL_OR_STOP_HANDLER,
+    ("IntentRequest", "AMAZON.StopIntent"): CANCEL_OR_STOP_HANDLER,
+    ("SessionEndedRequest", None): SESSION_ENDED_HANDLER,
+    ("IntentRequest", None): INTENT_REFLECTOR_HANDLER,
+}  # type: Dict[Tuple[str, Optional[str]], AbstractRequestHandler]
+
 # The SkillBuilder object acts as the entry point for your skill, routing all request and response
-# payloads to the handlers above. Make sure any new handlers or interceptors you've
-# defined are included below. The order matters - they're processed top to bottom.
+# payloads to the router above. Exception handling still goes through the SDK chain.
 
 
 sb = SkillBuilder()
 
-sb.add_request_handler(LaunchRequestHandler())
-sb.add_request_handler(HelloWorldIntentHandler())
-sb.add_request_handler(HelloWorldWithButtonIntentHandler())
-sb.add_request_handler(HelloWorldButtonEventHandler())
-sb.add_request_handler(StartOverIntentHandler())
+sb.add_request_handler(RequestRouter(_ROUTES))
+
+sb.add_exception_handler(CATCH_ALL_EXCEPTION_HANDLER)
 
-sb.add_request_handler(okIntentHandler())
-sb.add_request_handler(CardIntentHandler())
-sb.add_request_handler(HelpIntentHandler())
-sb.add_request_handler(CancelOrStopIntentHandler())
-sb.add_request_handler(SessionEndedRequestHandler())
-sb.add_request_handler(
-    IntentReflectorHandler())  # make sure IntentReflectorHandler is last so it doesn't override your custom intent handlers
+# SkillBuilder.lambda_handler() rebuilds the skill configuration and a new
+# CustomSkill on every invocation, so create the skill once per container and
+# reuse it across warm invocations instead.
+skill = sb.create()
 
-sb.add_exception_handler(CatchAllExceptionHandler())
 
-lambda_handler = sb.lambda_handler()
+def lambda_handler(event, context):
+    # type: (Dict[str, Any], Any) -> Dict[str, Any]
+    """Entry point for AWS Lambda, invoking the skill created at import."""
+    request_envelope = skill.serializer.deserialize(
+        payload=json.dumps(event), obj_type=RequestEnvelope)
+    response_envelope = skill.invoke(
+        request_envelope=request_envelope, context=context)
+    return skill.serializer.serialize(response_envelope)
+
+
+def _warm_up():
+    # type: () -> None
+    """Run a synthetic LaunchRequest through the skill so the serializer and
+    dispatch setup happen during cold start rather than on the first real
+    request. Failures are ignored; real requests surface any errors.
+    """
+    event = {
+        "version": "1.0",
+        "context": {"System": {"application": {"applicationId": "warmup"},
+                               "device": {"supportedInterfaces": {}}}},
+        "request": {"type": "LaunchRequest", "requestId": "warmup",
+                    "timestamp": "1970-01-01T00:00:00Z", "locale": "en-US"}
+    }
+    try:
+        lambda_handler(event, None)
+    except Exception:
+        pass
+
+
+_warm_up()